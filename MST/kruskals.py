@@ -6,8 +6,14 @@
 # __copyright__ = 'Copyright 2025, RMIT University'
 # -------------------------------------------------
 
+from typing import List
+
 from graph.graph import Graph
 
+# Largest edge weight for which the O(E) bucket sort is used in kruskalMST;
+# wider weight ranges fall back to the comparison sort.
+_BUCKET_WEIGHT_LIMIT = 64
+
 
 def kruskalMST(graph: Graph) -> Graph:
     """
@@ -27,68 +33,171 @@ def kruskalMST(graph: Graph) -> Graph:
     vertices = graph.getVertices()
     mst.addVertices(vertices)
 
-    all_edges = []
-    
-    processed_edges = set()
+    # Give each cell a dense integer id (row * cols + col) so all internal
+    # work runs on plain ints: the disjoint set lives in flat lists indexed
+    # at C speed, and the id -> Coordinate translation table is a flat list
+    # too, leaving no Coordinate hashing anywhere in the pipeline.
+    cols = graph.cols
+    size = graph.rows * cols
+    coord_of = [None] * size
+    for v in vertices:
+        coord_of[v.getRow() * cols + v.getCol()] = v
+
+    # Fetch each neighbour together with its weight in one scan where the
+    # graph supports it; otherwise fall back to a neighbours + getWeight pair,
+    # which costs a second adjacency lookup per edge.
+    fetch = getattr(graph, "neighboursWithWeight", None)
+    if fetch is None:
+        neighbours = graph.neighbours
+        get_weight = graph.getWeight
+
+        def fetch(u):
+            return [(v, get_weight(u, v)) for v in neighbours(u)]
+
+    # Preallocate the edge list so it never has to grow mid-scan. The graph
+    # reports its exact edge count where supported; otherwise 2 * size is a
+    # safe bound, as each grid cell contributes at most two u_id < v_id edges
+    # (right and down).
+    count = getattr(graph, "edgeCount", None)
+    bound = count() if count is not None else 2 * size
+    all_edges = [None] * bound
+    n_edges = 0
+    max_w = 0
+    # Uniform-weight mazes (and some generators) emit edges already in
+    # non-decreasing weight order; spotting that during the scan lets the
+    # ordering step below be skipped entirely.
+    is_sorted = True
+    prev_w = 0
 
     for u in vertices:
-        
-        for v in graph.neighbours(u):
-            edge_key = frozenset([u, v])
-            
-            
-            if edge_key in processed_edges:
-                continue
-            
-           
-            w = graph.getWeight(u, v)
-            
-            
-            if w > 0:
-                
-                all_edges.append((w, u, v))
-                processed_edges.add(edge_key)
-
-    all_edges.sort(key=lambda x: x[0])
-
-    parent = {v: v for v in vertices}
-
-    for w, u, v in all_edges:
-        
-        if union(u, v, parent):
-            mst.addEdge(u, v, w)
+        u_id = u.getRow() * cols + u.getCol()
+
+        for v, w in fetch(u):
+            v_id = v.getRow() * cols + v.getCol()
+
+            # Each undirected edge appears twice in the adjacency; keeping
+            # only the u_id < v_id orientation enumerates it exactly once,
+            # with a single int comparison instead of a seen-set lookup.
+            if u_id < v_id and w > 0:
+
+                all_edges[n_edges] = (w, u_id, v_id)
+                n_edges += 1
+                if w > max_w:
+                    max_w = w
+                elif w < prev_w:
+                    is_sorted = False
+                prev_w = w
+
+    del all_edges[n_edges:]
+
+    # Maze weights are small positive integers, so an O(E) bucket sort on the
+    # weight normally beats the O(E log E) comparison sort. Fall back to
+    # list.sort when the weight range is too wide for buckets to pay off;
+    # edges are (weight, u_id, v_id) int tuples, so the default tuple
+    # ordering sorts by weight without a key callable. Edges that arrived
+    # already in weight order need no ordering pass at all.
+    if is_sorted:
+        pass
+    elif max_w <= _BUCKET_WEIGHT_LIMIT:
+        buckets = [[] for _ in range(max_w + 1)]
+        for edge in all_edges:
+            buckets[edge[0]].append(edge)
+        all_edges = [edge for bucket in buckets for edge in bucket]
+    else:
+        all_edges.sort()
+
+    parent = list(range(size))
+    # Component size per root; merging the smaller component into the larger
+    # bounds tree height just like rank, and the counts are available should
+    # a caller ever want component sizes.
+    comp_size = [1] * size
+
+    # A spanning tree has exactly V - 1 edges, so once that many have been
+    # accepted every remaining edge would form a cycle and can be skipped.
+    added = 0
+    target = len(vertices) - 1
+
+    # Bind the edge insert as a local: a local load is cheaper than an
+    # attribute lookup on every one of the O(E) iterations. Every accepted
+    # edge is adjacent, unique and positive by construction, so use the
+    # graph's unchecked insert where it offers one rather than re-validating
+    # each edge in addEdge.
+    add_edge = getattr(mst, "_unsafe_addEdge", None)
+    if add_edge is None:
+        add_edge = mst.addEdge
+
+    # This loop dominates the runtime, so the find/union helpers are inlined
+    # here (with path halving) to avoid two Python function calls per edge.
+    # It is all plain integer work and would suit a JIT, but the project has
+    # no numba/NumPy dependency, so tightening the interpreted loop is the
+    # pragmatic equivalent.
+    for w, u_id, v_id in all_edges:
+
+        root_u = u_id
+        while parent[root_u] != root_u:
+            parent[root_u] = root_u = parent[parent[root_u]]
+
+        root_v = v_id
+        while parent[root_v] != root_v:
+            parent[root_v] = root_v = parent[parent[root_v]]
+
+        if root_u != root_v:
+            if comp_size[root_u] < comp_size[root_v]:
+                root_u, root_v = root_v, root_u
+            parent[root_v] = root_u
+            comp_size[root_u] += comp_size[root_v]
+
+            add_edge(coord_of[u_id], coord_of[v_id], w)
+            added += 1
+            if added == target:
+                break
 
     return mst
 
 
-def find(coord, parent):
+def find(vert_id: int, parent: List[int]) -> int:
     """
-    Recursively finds the root of the set containing `coord` using path compression.
+    Iteratively finds the root of the set containing `vert_id` using path compression.
+    A first pass walks up to the root, a second pass repoints every node on the
+    path directly at it. Avoids the recursion depth limit (and the per-level
+    function call cost) on long chains.
 
-    @param coord: The coordinate whose set root is being queried.
-    @param parent: A mapping from each coordinate to its parent in the disjoint set forest.
+    @param vert_id: Integer id of the vertex whose set root is being queried.
+    @param parent: List mapping each vertex id to its parent in the disjoint set forest.
 
-    @returns: The root coordinate of the set containing `coord`.
+    @returns: The root id of the set containing `vert_id`.
     """
-    if parent[coord] != coord:
-        parent[coord] = find(parent[coord], parent)
-    return parent[coord]
+    root = vert_id
+    while parent[root] != root:
+        root = parent[root]
+    while parent[vert_id] != root:
+        nxt = parent[vert_id]
+        parent[vert_id] = root
+        vert_id = nxt
+    return root
 
 
-def union(a, b, parent):
+def union(a: int, b: int, parent: List[int], size: List[int]) -> bool:
     """
-    Attempts to unite the sets containing `a` and `b`.
+    Attempts to unite the sets containing `a` and `b` using union by size.
+    The smaller component is attached under the larger one, which bounds
+    tree height the same way union by rank does, so trees stay shallow and
+    subsequent `find` calls traverse fewer links.
 
-    @param a: First coordinate.
-    @param b: Second coordinate.
-    @param parent: Disjoint set parent mapping.
+    @param a: Integer id of the first vertex.
+    @param b: Integer id of the second vertex.
+    @param parent: Disjoint set parent list, indexed by vertex id.
+    @param size: List giving, for each root id, the size of its component.
 
     @returns: True if the union was successful (i.e., no cycle formed), False otherwise.
     """
 
     root_a = find(a, parent)
     root_b = find(b, parent)
-    if root_a != root_b:
-        parent[root_b] = root_a
-        return True
-    return False
+    if root_a == root_b:
+        return False
+    if size[root_a] < size[root_b]:
+        root_a, root_b = root_b, root_a
+    parent[root_b] = root_a
+    size[root_a] += size[root_b]
+    return True
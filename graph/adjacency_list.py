@@ -32,8 +32,18 @@ class AdjacencyListGraph(Graph):
         # Set of all vertices
         self.vertices: List[Coordinate] = []
 
-        # Adjacency list: Coordinate → List[Tuple[Coordinate, weight]]
-        self.adj_list: Dict[Coordinate, List[Tuple[Coordinate, int]]] = {}
+        # Adjacency list: Coordinate → Dict[Coordinate, weight].
+        # A dict per vertex makes edge lookup/update/removal O(1) dict ops
+        # instead of linear scans of a tuple list.
+        # Invariant: every stored weight is positive. Walls are represented
+        # by the absence of an edge (updateWall removes it) and every writer
+        # rejects non-positive weights, so readers never need to filter.
+        self.adj_list: Dict[Coordinate, Dict[Coordinate, int]] = {}
+
+        # Cache of neighbours() results, invalidated whenever the edges of a
+        # vertex change. Solvers call neighbours repeatedly on an unchanged
+        # maze, so the filtered list only has to be built once per vertex.
+        self._nbr_cache: Dict[Coordinate, List[Coordinate]] = {}
 
     def addVertex(self, label: Coordinate):
         """
@@ -42,46 +52,49 @@ class AdjacencyListGraph(Graph):
         @param label: Coordinate of the room.
         """
         if label not in self.adj_list:
-            self.adj_list[label] = []
+            self.adj_list[label] = {}
             self.vertices.append(label)
 
         # ------------------- Helper Methods -------------------
 
-    def _get_edge(self, vert1: Coordinate, vert2: Coordinate) -> Tuple[Coordinate, int] | None:
+    def _get_edge(self, vert1: Coordinate, vert2: Coordinate) -> int | None:
         """
         Internal helper to find the edge between vert1 and vert2.
-        Returns the tuple (vert2, weight) if exists, else None.
+        Returns the weight if the edge exists, else None.
         """
-        if vert1 not in self.adj_list:
+        edges = self.adj_list.get(vert1)
+        if edges is None:
             return None
-        for v, w in self.adj_list[vert1]:
-            if v == vert2:
-                return (v, w)
-        return None
+        return edges.get(vert2)
 
     def _update_edge_in_list(self, vert1: Coordinate, vert2: Coordinate, weight: int) -> bool:
         """
         Internal helper to update the weight of an existing edge.
         Returns True if updated, False if edge does not exist.
         """
-        if vert1 not in self.adj_list:
+        edges = self.adj_list.get(vert1)
+        if edges is None or vert2 not in edges:
             return False
-        for idx, (v, w) in enumerate(self.adj_list[vert1]):
-            if v == vert2:
-                self.adj_list[vert1][idx] = (v, weight)
-                return True
-        return False
+        edges[vert2] = weight
+        return True
+
+    def _invalidate_cache(self, vert1: Coordinate, vert2: Coordinate):
+        """
+        Internal helper to drop the cached neighbour lists of both endpoints
+        after an edge mutation.
+        """
+        self._nbr_cache.pop(vert1, None)
+        self._nbr_cache.pop(vert2, None)
 
     def _remove_edge_from_list(self, vert1: Coordinate, vert2: Coordinate) -> bool:
         """
         Internal helper to remove the edge from vert1 to vert2.
         Returns True if removed, False if edge did not exist.
         """
-        if vert1 not in self.adj_list:
+        edges = self.adj_list.get(vert1)
+        if edges is None:
             return False
-        original_len = len(self.adj_list[vert1])
-        self.adj_list[vert1] = [(v, w) for v, w in self.adj_list[vert1] if v != vert2]
-        return len(self.adj_list[vert1]) < original_len
+        return edges.pop(vert2, None) is not None
 
     def addVertices(self, vertLabels: List[Coordinate]):
         """
@@ -122,10 +135,26 @@ class AdjacencyListGraph(Graph):
             return False
 
         # Add undirected edge
-        self.adj_list[vert1].append((vert2, weight))
-        self.adj_list[vert2].append((vert1, weight))
+        self.adj_list[vert1][vert2] = weight
+        self.adj_list[vert2][vert1] = weight
+        self._invalidate_cache(vert1, vert2)
         return True
 
+    def _unsafe_addEdge(self, vert1: Coordinate, vert2: Coordinate, weight: int):
+        """
+        Internal fast path to insert an edge the caller already knows is
+        valid: both vertices present, adjacent, positive weight and not yet
+        connected. Skips the checks addEdge performs on every call, which
+        algorithms such as Kruskal's can guarantee themselves.
+
+        @param vert1: Source room.
+        @param vert2: Destination room.
+        @param weight: Movement cost.
+        """
+        self.adj_list[vert1][vert2] = weight
+        self.adj_list[vert2][vert1] = weight
+        self._invalidate_cache(vert1, vert2)
+
     def updateWall(self, vert1: Coordinate, vert2: Coordinate, hasWall: bool, weight: int = 1) -> bool:
         """
         Updates wall status between two rooms.
@@ -149,23 +178,26 @@ class AdjacencyListGraph(Graph):
             # Add wall: remove the edge from both lists
             self._remove_edge_from_list(vert1, vert2)
             self._remove_edge_from_list(vert2, vert1)
+            self._invalidate_cache(vert1, vert2)
             # Edge is now absent, so wall status is correct
-            return True 
+            return True
         else: # hasWall is False, remove wall (add/update edge with positive weight)
             # Ensure weight is positive when removing a wall
             if weight <= 0:
                 return False
-                
+
             # Check if edge already exists
             if self._get_edge(vert1, vert2) is not None:
                 # Edge exists, update weight
                 updated_1 = self._update_edge_in_list(vert1, vert2, weight)
                 updated_2 = self._update_edge_in_list(vert2, vert1, weight)
+                self._invalidate_cache(vert1, vert2)
                 return updated_1 and updated_2
             else:
                 # Edge does not exist, add it
-                self.adj_list[vert1].append((vert2, weight))
-                self.adj_list[vert2].append((vert1, weight))
+                self.adj_list[vert1][vert2] = weight
+                self.adj_list[vert2][vert1] = weight
+                self._invalidate_cache(vert1, vert2)
                 return True
 
     def print(self):
@@ -181,8 +213,8 @@ class AdjacencyListGraph(Graph):
         @returns None
         """
         for u in self.vertices:
-            edges = self.adj_list.get(u, [])
-            edge_strs = [f"({v.getRow()}, {v.getCol()}), {w}" for v, w in edges]
+            edges = self.adj_list.get(u, {})
+            edge_strs = [f"({v.getRow()}, {v.getCol()}), {w}" for v, w in edges.items()]
             print(f"({u.getRow()}, {u.getCol()}) -> [{'; '.join(edge_strs)}]")
 
     def removeEdge(self, vert1: Coordinate, vert2: Coordinate) -> bool:
@@ -216,9 +248,8 @@ class AdjacencyListGraph(Graph):
 
         @returns True if edge exists and is traversable.
         """
-        edge = self._get_edge(vert1, vert2)
-        # An edge is traversable if it is in the list AND the weight is positive.
-        return edge is not None and edge[1] > 0
+        # Stored weights are positive by invariant, so presence is enough.
+        return self._get_edge(vert1, vert2) is not None
 
     def getWallStatus(self, vert1: Coordinate, vert2: Coordinate) -> bool:
         """
@@ -244,9 +275,9 @@ class AdjacencyListGraph(Graph):
 
         @returns positive integer if edge exists, 0 otherwise.
         """
-        edge = self._get_edge(vert1, vert2)
-        # Return weight if edge exists and is positive (traversable), else 0
-        return edge[1] if edge is not None and edge[1] > 0 else 0
+        # Stored weights are positive by invariant; absence means a wall.
+        weight = self._get_edge(vert1, vert2)
+        return weight if weight is not None else 0
 
     def getVertices(self) -> List[Coordinate]:
         return self.vertices
@@ -262,5 +293,34 @@ class AdjacencyListGraph(Graph):
         if label not in self.adj_list:
             return []
 
-        # Return only neighbors with a positive weight (traversable path)
-        return [neighbor for neighbor, weight in self.adj_list[label] if weight > 0]
\ No newline at end of file
+        cached = self._nbr_cache.get(label)
+        if cached is not None:
+            return cached
+
+        # Every stored edge is traversable by invariant, so the neighbour
+        # list is simply the adjacency dict's keys.
+        result = list(self.adj_list[label])
+        self._nbr_cache[label] = result
+        return result
+
+    def neighboursWithWeight(self, label: Coordinate) -> List[Tuple[Coordinate, int]]:
+        """
+        Retrieves all accessible adjacent rooms together with their edge weights.
+        One walk of the adjacency list yields both, so callers avoid a second
+        linear scan via getWeight for every neighbour.
+
+        @param label: Coordinate of the room.
+
+        @returns List of (neighbour, weight) tuples for traversable edges.
+        """
+        return list(self.adj_list.get(label, {}).items())
+
+    def edgeCount(self) -> int:
+        """
+        Counts the traversable undirected edges in the graph.
+        Each edge is stored in both directions, so the total is halved.
+
+        @returns Number of undirected edges with positive weight.
+        """
+        directed = sum(len(edges) for edges in self.adj_list.values())
+        return directed // 2
\ No newline at end of file
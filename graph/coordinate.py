@@ -20,6 +20,9 @@ class Coordinate:
         """
         self.m_r = row
         self.m_c = col
+        # Coordinates are effectively immutable, so the hash can be computed
+        # once here rather than on every dict/set lookup.
+        self._hash = hash((row, col))
 
     def getRow(self) -> int:
         """@returns Row of coordinate."""
@@ -44,6 +47,8 @@ class Coordinate:
         """
         Overload the == operator.
         """
+        if other is self:  # same object is trivially equal
+            return True
         if isinstance(other, Coordinate):  # check other "thing" is a coordinate
             return self.m_r == other.getRow() and self.m_c == other.getCol()  # check row and column are the same
         return False
@@ -51,8 +56,10 @@ class Coordinate:
     def __hash__(self) -> int:
         """
         Returns hash value of Coordinates. Needed for being a key in dictionaries.
+        The value is precomputed in the constructor, so this is a plain
+        attribute read instead of a tuple allocation and hash per call.
         """
-        return hash((self.m_r, self.m_c))
+        return self._hash
 
     def __repr__(self):
         return f"Coordinates({self.m_r}, {self.m_c})"